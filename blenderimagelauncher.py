@@ -6,11 +6,31 @@ Usage: blenderimagelauncher.py <image_or_svg_paths_or_folders> <options>
 Author: Shrinivas Kulkarni (khemadeva@gmail.com)
 """
 
+from __future__ import annotations
+
 import sys, os
-from types import FunctionType
-from typing import Any, Dict, List, Optional, Set, Tuple, cast
-from pathlib import Path
-from glob import glob
+
+_SCRIPT_PATH = os.path.abspath(__file__)
+_BLENDER_COMMAND = ("blender", "--python", _SCRIPT_PATH, "--", "embedded")
+
+EXTENSIONS = frozenset(
+    # Images
+    {".png", ".jpg", ".jpeg", ".gif", ".bmp", ".webp"}
+    # Videos
+    | {".mp4", ".avi", ".mov", ".wmv", ".mkv", ".flv"}
+)
+
+# importer string -> resolved callable, see resolve_importer
+_IMPORTERS: dict = {}
+
+if sys.platform.startswith("win"):
+    import subprocess
+
+    _WIN_FLAGS = (
+        subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP  # type: ignore
+    )
+else:
+    _WIN_FLAGS = 0
 
 
 def launch(args: List[str], term: str) -> None:
@@ -20,160 +40,209 @@ def launch(args: List[str], term: str) -> None:
         args (List[str]): The command line arguments for Blender.
         term (str): Optional terminal to use for launching Blender.
     """
-    import subprocess
+    command = [term] if term else []
+    command.extend(_BLENDER_COMMAND)
+    command.extend(args)
 
-    command = (
-        ([term] if term else [])
-        + [
-            "blender",
-            "--python",
-            os.path.abspath(__file__),
-            "--",
-            "embedded",
-        ]
-        + args
-    )
-    kwargs = {
-        "stdin": subprocess.DEVNULL,
-        "stdout": subprocess.DEVNULL,
-        "stderr": subprocess.STDOUT,
-        "close_fds": True,
-    }
-
-    # Adjust parameters for different operating systems
     if sys.platform.startswith("win"):
         # Windows-specific settings (not tested)
-        kwargs["creationflags"] = (
-            subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP  # type: ignore
+        subprocess.Popen(
+            command,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.STDOUT,
+            close_fds=True,
+            creationflags=_WIN_FLAGS,
         )
     else:
-        # POSIX-specific settings
-        kwargs["start_new_session"] = True
-
-    # Start the subprocess detached from the parent process
-    subprocess.Popen(command, **kwargs)
+        # POSIX: spawn directly in a new session with stdio on /dev/null,
+        # no fork of this interpreter and no Popen pipe machinery needed
+        file_actions = [
+            (os.POSIX_SPAWN_OPEN, 0, os.devnull, os.O_RDONLY, 0),
+            (os.POSIX_SPAWN_OPEN, 1, os.devnull, os.O_WRONLY, 0),
+            (os.POSIX_SPAWN_DUP2, 1, 2),
+        ]
+        os.posix_spawnp(
+            command[0], command, os.environ, file_actions=file_actions, setsid=True
+        )
 
 
 def get_file_list(ip_paths: List[str]) -> List[str]:
     file_list: List[str] = []
 
     for ip_path in ip_paths:
-        path_ip = Path(ip_path)
-        if path_ip.is_dir():
-            # Images
-            extensions = {".png", ".jpg", ".jpeg", ".gif", ".bmp", ".webp"}
-            # Videos
-            extensions.update({".mp4", ".avi", ".mov", ".wmv", ".mkv", ".flv"})
-            file_list = sorted(
-                [
-                    str(f)
-                    for f in path_ip.iterdir()
-                    if f.suffix in extensions or "*" in extensions
+        if os.path.isdir(ip_path):
+            with os.scandir(ip_path) as it:
+                entries = [
+                    entry
+                    for entry in it
+                    if os.path.splitext(entry.name)[1].lower() in EXTENSIONS
+                    and entry.is_file()
                 ]
-            )
+            # Same folder, so sorting on the name alone gives the path order
+            entries.sort(key=attrgetter("name"))
+            file_list.extend(entry.path for entry in entries)
         else:
-            file_list += glob(ip_path)
+            file_list.extend(iglob(ip_path))
     return file_list
 
 
-def import_svg(svg_file_path: str, importer: str) -> Set:
-    before_import = set(bpy.data.objects)
-    components = importer.split(".")
-    mod = bpy
-    for comp in components[1:]:
-        mod = getattr(mod, comp)
-    cast(FunctionType, mod)(filepath=svg_file_path)
+def resolve_importer(importer: str) -> Callable:
+    # Memoized lookup of e.g. "bpy.ops.import_curve.svg"
+    importer_fn = _IMPORTERS.get(importer)
+    if importer_fn is None:
+        importer_fn = reduce(getattr, importer.split(".")[1:], bpy)
+        _IMPORTERS[importer] = importer_fn
+    return importer_fn
 
-    return set(bpy.data.objects) - before_import
 
+def import_svg(svg_file_path: str, importer_fn: Callable) -> List:
+    before_import = frozenset(obj.name for obj in bpy.data.objects)
+    importer_fn(filepath=svg_file_path)
 
-def get_svg_bound_box(svg_objs: Set) -> Optional[Tuple[float, ...]]:
-    corners = [
-        obj.matrix_world @ mathutils.Vector(corner)
-        for obj in svg_objs
-        if obj.type == "CURVE"
-        for corner in obj.bound_box
-    ]
-    return (
-        (
-            tuple(min(c[i] for c in corners) for i in range(3))
-            + tuple(max(c[i] for c in corners) for i in range(3))
-        )
-        if corners
-        else None
+    return [obj for obj in bpy.data.objects if obj.name not in before_import]
+
+
+def get_svg_bound_box(svg_objs: List) -> Optional[Tuple[float, ...]]:
+    curves = [obj for obj in svg_objs if obj.type == "CURVE"]
+    if not curves:
+        return None
+    # Transform all the bound box corners to world space in one go
+    mats = np.array([obj.matrix_world for obj in curves])  # (N, 4, 4)
+    corners = np.array([obj.bound_box for obj in curves])  # (N, 8, 3)
+    world = (
+        np.einsum("nij,nkj->nki", mats[:, :3, :3], corners) + mats[:, None, :3, 3]
     )
+    return tuple(world.min((0, 1)).tolist() + world.max((0, 1)).tolist())
 
 
 def shift_origin(obj: "bpy.types.Object", origin: "mathutils.Vector") -> None:
     o_loc = obj.location.copy()
     inv_mw = obj.matrix_world.inverted_safe()
-    delta = inv_mw @ o_loc - inv_mw @ origin
-    for s in cast(bpy.types.Curve, obj.data).splines:
-        for bpt in s.bezier_points:
-            lht, rht = bpt.handle_left_type, bpt.handle_right_type
-            bpt.handle_left_type = bpt.handle_right_type = "FREE"
-            bpt.co += delta
-            bpt.handle_left += delta
-            bpt.handle_right += delta
-            bpt.handle_left_type, bpt.handle_right_type = lht, rht
+    delta = np.array(inv_mw @ o_loc - inv_mw @ origin, dtype=np.float32)
+    data = cast(bpy.types.Curve, obj.data)
+    # Raw foreach access doesn't recalculate handles, so no need to switch
+    # them to FREE; all three get the same offset anyway
+    for s in data.splines:
+        bpts = s.bezier_points
+        buf = np.empty(len(bpts) * 3, dtype=np.float32)
+        for attr in ("co", "handle_left", "handle_right"):
+            bpts.foreach_get(attr, buf)
+            bpts.foreach_set(attr, (buf.reshape(-1, 3) + delta).ravel())
+    data.update_tag()
     obj.location = origin
 
 
-def process_svg(image_path: str, importer: str) -> Optional[Tuple[Any, List[float]]]:
-    new_objs = import_svg(image_path, importer)
+def process_svg(
+    image_path: str, importer_fn: Callable
+) -> Optional[Tuple[Any, List[float]]]:
+    new_objs = import_svg(image_path, importer_fn)
     bbox = get_svg_bound_box(new_objs)
     if not bbox:
         return None
     dims = [bbox[3] - bbox[0], bbox[4] - bbox[1]]
     obj_origin = mathutils.Vector([bbox[0] + dims[0] / 2, bbox[1] + dims[1] / 2, 0])
-    for obj in new_objs.copy():
+    kept, degenerate = [], []
+    for obj in new_objs:
         if obj.type == "CURVE":
             data = cast(bpy.types.Curve, obj.data)
             # Do some cleanup (single point curves create issue with bound_box)
             if len(data.splines) == 0 or len(data.splines[0].bezier_points) <= 1:
-                bpy.data.objects.remove(obj, do_unlink=True)
-                new_objs.remove(obj)
-            else:
-                shift_origin(obj, obj_origin)
-                obj.location = (0, 0, 0)
-    return new_objs, dims
+                degenerate.append(obj)
+                continue
+            shift_origin(obj, obj_origin)
+            obj.location = (0, 0, 0)
+        kept.append(obj)
+    if degenerate:
+        bpy.data.batch_remove(ids=degenerate)
+    return kept, dims
+
+
+def create_image_material(
+    img: "bpy.types.Image", no_emit: bool
+) -> "bpy.types.Material":
+    mat = bpy.data.materials.new(name=img.name)
+    mat.use_nodes = True
+    mat.blend_method = "BLEND"
+    nodes, links = mat.node_tree.nodes, mat.node_tree.links
+    nodes.clear()
+
+    tex = cast(bpy.types.ShaderNodeTexImage, nodes.new(type="ShaderNodeTexImage"))
+    tex.image = img
+    tex.extension = "CLIP"
+    if img.source == "MOVIE":
+        tex.image_user.frame_duration = img.frame_duration
+        tex.image_user.use_auto_refresh = True
+
+    output = nodes.new(type="ShaderNodeOutputMaterial")
+    if no_emit:
+        shader = nodes.new(type="ShaderNodeBsdfPrincipled")
+        links.new(tex.outputs["Color"], shader.inputs["Base Color"])
+        links.new(tex.outputs["Alpha"], shader.inputs["Alpha"])
+        links.new(shader.outputs["BSDF"], output.inputs["Surface"])
+    else:
+        # Emission mixed with transparent by the image alpha
+        emission = nodes.new(type="ShaderNodeEmission")
+        transparent = nodes.new(type="ShaderNodeBsdfTransparent")
+        mix = nodes.new(type="ShaderNodeMixShader")
+        links.new(tex.outputs["Color"], emission.inputs["Color"])
+        links.new(tex.outputs["Alpha"], mix.inputs["Fac"])
+        links.new(transparent.outputs["BSDF"], mix.inputs[1])
+        links.new(emission.outputs["Emission"], mix.inputs[2])
+        links.new(mix.outputs["Shader"], output.inputs["Surface"])
+    return mat
 
 
 def process_image(image_path: str, no_emit: bool) -> Optional[Tuple[Any, List[float]]]:
-    bpy.ops.preferences.addon_enable(module="io_import_images_as_planes")
-    bpy.ops.import_image.to_plane(  # type: ignore
-        files=[{"name": image_path}],
-        directory="",
-        shader="PRINCIPLED" if no_emit else "EMISSION",
-        align_axis="Z+",
-        relative=False,
+    try:
+        img = bpy.data.images.load(image_path, check_existing=True)
+    except RuntimeError:
+        return None
+    w, h = img.size
+    if not w or not h:
+        return None
+
+    # Unit height plane facing +Z, like Import Images as Planes defaults
+    dims = [w / h, 1.0]
+    hw = dims[0] / 2
+    mesh = bpy.data.meshes.new(img.name)
+    mesh.from_pydata(
+        [(-hw, -0.5, 0), (hw, -0.5, 0), (hw, 0.5, 0), (-hw, 0.5, 0)], [], [(0, 1, 2, 3)]
     )
-    obj = bpy.context.object
-    return [obj], obj.dimensions[:2]  # type: ignore
+    mesh.uv_layers.new().data.foreach_set("uv", (0, 0, 1, 0, 1, 1, 0, 1))
+    mesh.materials.append(create_image_material(img, no_emit))
 
+    obj = bpy.data.objects.new(img.name, mesh)
+    bpy.context.collection.objects.link(obj)
+    return [obj], dims
 
-def adjust_render_resolution(first_dims: List[float]) -> None:
-    ratio = first_dims[0] / first_dims[1]
-    render = bpy.context.scene.render
+
+def adjust_render_resolution(first_dims: List[float], scene: "bpy.types.Scene") -> None:
+    # Integer aspect (in millionths) with rounded division, float
+    # truncation gives off-by-ones like 1079 for a 16:9 image at 1920
+    dw, dh = round(first_dims[0] * 1e6), round(first_dims[1] * 1e6)
+    render = scene.render
     x, y = render.resolution_x, render.resolution_y
     render.resolution_x, render.resolution_y = (
-        (int(y * ratio), y) if x < y else (x, int(x / ratio))
+        ((y * dw + dh // 2) // dh, y) if x < y else (x, (x * dh + dw // 2) // dw)
     )
 
 
-def set_view_mode(camera_loc: List[float], first_dims: List[float]) -> None:
-    for area in bpy.context.screen.areas:
-        if area.type == "VIEW_3D":
-            space = cast(bpy.types.SpaceView3D, area.spaces.active)
-            space.shading.type = "RENDERED"
-            space.region_3d.view_perspective = "ORTHO"
-            space.region_3d.view_rotation = (1.0, 0.0, 0.0, 0.0)
-            space.region_3d.view_location = camera_loc
-            space.region_3d.view_distance = max(first_dims) * 1.5
+def set_view_mode(
+    camera_loc: List[float], first_dims: List[float], space: "bpy.types.SpaceView3D"
+) -> None:
+    space.shading.type = "RENDERED"
+    r3d = space.region_3d
+    r3d.view_perspective = "ORTHO"
+    r3d.view_rotation = (1.0, 0.0, 0.0, 0.0)
+    r3d.view_location = camera_loc
+    r3d.view_distance = max(first_dims) * 1.5
 
 
 def setup_camera(camera_loc: List[float], first_dims, margin) -> None:
-    camera = bpy.data.objects["Camera"]
+    camera = bpy.data.objects.get("Camera")
+    if camera is None:
+        return
     camera.location = (*camera_loc[:2], 2)
     camera.rotation_euler = (0, 0, 0)
     cdata = cast(bpy.types.Camera, camera.data)
@@ -182,50 +251,50 @@ def setup_camera(camera_loc: List[float], first_dims, margin) -> None:
     camera.hide_set(True)
 
 
-def adjust_lighting() -> None:
-    bpy.context.scene.view_settings.view_transform = "Standard"
+def adjust_lighting(scene: "bpy.types.Scene") -> None:
+    scene.view_settings.view_transform = "Standard"
 
-    world = bpy.data.worlds["World"]
+    world = bpy.data.worlds.get("World")
+    if world is None:
+        return
     world.use_nodes = True
     nodes = world.node_tree.nodes
+    links = world.node_tree.links
 
-    output = (
-        [n for n in nodes if n.type == "OUTPUT_WORLD"]
-        or [nodes.new(type="ShaderNodeOutputWorld")]
-    )[0]
+    output = next(
+        (n for n in nodes if n.type == "OUTPUT_WORLD"), None
+    ) or nodes.new(type="ShaderNodeOutputWorld")
 
-    for input in output.inputs:
-        for link in input.links:
-            world.node_tree.links.remove(link)
+    # Snapshot first, removing while iterating socket links is quadratic
+    for link in [link for input in output.inputs for link in input.links]:
+        links.remove(link)
 
     node = nodes.new(type="ShaderNodeEmission")
     strength = cast(bpy.types.NodeSocketFloat, node.inputs["Strength"])
     strength.default_value = 0
-    world.node_tree.links.new(node.outputs["Emission"], output.inputs["Surface"])
+    links.new(node.outputs["Emission"], output.inputs["Surface"])
 
 
-def get_override(area_type, region_type) -> Optional[Dict]:
-    for area in bpy.context.screen.areas:
-        if area.type == area_type:
-            for region in area.regions:
-                if region.type == region_type:
-                    override = {
-                        "area": area,
-                        "region": region,
-                        "screen": bpy.context.screen,
-                        "window": bpy.context.window,
-                        "blend_data": bpy.context.blend_data,
-                    }
-                    return override
-    return None
-
-
-def setBg(color=(1, 1, 1, 1)) -> None:
-    bpy.context.scene.render.film_transparent = True
-    bpy.context.scene.view_settings.view_transform = "Standard"
-    bpy.context.scene.use_nodes = True
-
-    tree = bpy.context.scene.node_tree
+def get_override(area_regions: Dict, area_type, region_type) -> Optional[Dict]:
+    area_region = area_regions.get((area_type, region_type))
+    if not area_region:
+        return None
+    area, region = area_region
+    return {
+        "area": area,
+        "region": region,
+        "screen": bpy.context.screen,
+        "window": bpy.context.window,
+        "blend_data": bpy.context.blend_data,
+    }
+
+
+def setBg(scene: "bpy.types.Scene", area_regions: Dict, color=(1, 1, 1, 1)) -> None:
+    scene.render.film_transparent = True
+    scene.view_settings.view_transform = "Standard"
+    scene.use_nodes = True
+
+    tree = scene.node_tree
     tree.nodes.new(type="CompositorNodeAlphaOver")
     alpha = cast(
         bpy.types.CompositorNodeAlphaOver,
@@ -240,7 +309,7 @@ def setBg(color=(1, 1, 1, 1)) -> None:
 
     render = tree.nodes["Render Layers"]
     links.new(render.outputs[0], alpha.inputs[2])
-    override = get_override("VIEW_3D", "WINDOW")
+    override = get_override(area_regions, "VIEW_3D", "WINDOW")
     if override:
         with bpy.context.temp_override(**override):
             bpy.context.space_data.shading.use_compositor = "ALWAYS"  # type: ignore
@@ -256,52 +325,53 @@ def setup_objects(
     importer: str,
 ) -> Tuple[Optional[List[float]], Optional[List[float]]]:
     next_x = 0
-    next_y = 0
-    row_objs = []
+    row_len = 0
     row_height = 0
+    row_heights: List[float] = []
+    placed: List[Tuple[Any, float, int]] = []  # (obj, x, row index)
 
-    dims: List[float] = [0, 0]
-    camera_loc = None
-    first_dims = None
-    first_iter = True
-
-    def shift_obj_y():
-        nonlocal next_y, row_objs, row_height
-        next_y -= row_height / 2
-        for sobj in row_objs:
-            sobj.location[1] += next_y
-
-    image_paths = get_file_list(ip_paths)
-    for i, image_path in enumerate(image_paths):
-        result = (
-            process_svg(image_path, importer)
-            if image_path.endswith(".svg")
-            else process_image(image_path, no_emit)
-        )
-        if not result:
-            continue
-        new_objs, dims = result
+    # Resolve the importer once, not per svg
+    importer_fn = resolve_importer(importer)
+
+    # Bind the loaders once, the loop then only picks one per path
+    load_svg = partial(process_svg, importer_fn=importer_fn)
+    load_image = partial(process_image, no_emit=no_emit)
+    imported = filter(
+        None,
+        (
+            (load_svg if image_path.endswith(".svg") else load_image)(image_path)
+            for image_path in get_file_list(ip_paths)
+        ),
+    )
 
-        if first_iter:
-            first_dims = dims
+    # The first import sets up the camera and view, take it out of the loop
+    first = next(imported, None)
+    if not first:
+        return None, None
+    first_objs, first_dims = first
+    camera_loc = first_objs[0].location if first_objs else None
 
-        if row_objs and (
+    for new_objs, dims in chain([first], imported):
+        if row_len and (
             (max_width and (next_x + dims[0]) > max_width)
-            or (max_width <= 0 and col_count and not i % col_count)
+            or (max_width <= 0 and col_count and row_len == col_count)
         ):
-            shift_obj_y()
-            next_y -= row_height / 2 + y_offset
-            row_objs, row_height, next_x = [], 0, 0
+            row_heights.append(row_height)
+            row_len, row_height, next_x = 0, 0, 0
         next_x += dims[0] / 2
-        for j, new_obj in enumerate(new_objs):
-            new_obj.location[0] = next_x
-            if first_iter and j == 0:
-                camera_loc = new_obj.location
+        placed.extend((new_obj, next_x, len(row_heights)) for new_obj in new_objs)
         next_x += dims[0] / 2 + x_offset
-        row_objs += new_objs
+        row_len += 1
         row_height = max(row_height, dims[1])
-        first_iter = False
-    shift_obj_y()
+    row_heights.append(row_height)
+
+    # Row centres stacked downwards from y = 0, each object is moved once
+    heights = np.array(row_heights)
+    row_ys = (
+        heights / 2 - np.cumsum(heights) - y_offset * np.arange(len(heights))
+    ).tolist()
+    for obj, x, row in placed:
+        obj.location.xy = x, obj.location.y + row_ys[row]
     return first_dims, camera_loc
 
 
@@ -354,31 +424,44 @@ def setup(
         images as specified.
     """
 
+    # Walk the context once and hand the pieces to the helpers
+    scene = bpy.context.scene
+    # (area type, region type) -> first matching (area, region)
+    area_regions: Dict = {}
+    for area in bpy.context.screen.areas:
+        for region in area.regions:
+            area_regions.setdefault((area.type, region.type), (area, region))
+    view3d = area_regions.get(("VIEW_3D", "WINDOW"), (None, None))[0]
+    space = cast(bpy.types.SpaceView3D, view3d.spaces.active) if view3d else None
+
     first_dims, camera_loc = setup_objects(
         ip_paths, no_emit, x_offset, y_offset, max_width, col_count, importer
     )
     if first_dims and not no_res:
-        adjust_render_resolution(first_dims)
+        adjust_render_resolution(first_dims, scene)
 
-    if first_dims and camera_loc and not no_view:
-        set_view_mode(camera_loc, first_dims)
+    if first_dims and camera_loc and space and not no_view:
+        set_view_mode(camera_loc, first_dims, space)
 
     if first_dims and camera_loc and not no_camera:
         setup_camera(camera_loc, first_dims, margin)
 
     if not no_light:
-        adjust_lighting()
+        adjust_lighting(scene)
 
     if not keep_cube:
-        bpy.data.objects.remove(bpy.data.objects["Cube"], do_unlink=True)
+        cube = bpy.data.objects.get("Cube")
+        if cube is not None:
+            bpy.data.batch_remove(ids=(cube,))
 
     if not no_bg:
-        setBg()
+        setBg(scene, area_regions)
 
-    if ds_spl:
-        bpy.context.preferences.view.show_splash = False
-    if en_spl:
-        bpy.context.preferences.view.show_splash = True
+    # Only write when it changes, writing tags the preferences as dirty
+    show_splash = True if en_spl else (False if ds_spl else None)
+    prefs_view = bpy.context.preferences.view
+    if show_splash is not None and prefs_view.show_splash != show_splash:
+        prefs_view.show_splash = show_splash
 
 
 def generate_help(bool_opts, param_opts):
@@ -429,29 +512,43 @@ if __name__ == "__main__":
     args = sys.argv[1:]
 
     if "embedded" in args:
+        # Only needed inside Blender, keep them off the launcher's startup path
+        from functools import partial, reduce
+        from itertools import chain
+        from operator import attrgetter
+        from typing import Any, Callable, Dict, List, Optional, Tuple, cast
+        from glob import iglob
+
         import bpy
         import mathutils
+        import numpy as np
 
         args = args[args.index("embedded") + 1 :]
 
-        # keep_cube, no_emit, no_res, no_view, no_camera, no_light, dis_spl, en_spl
+        # keep_cube, no_emit, no_res, no_view, no_camera, no_light, dis_spl, en_spl,
+        # no_bg
         flags = [False] * len(bool_opts)
 
-        # x_offset, y_offset, max_width, col_count
+        # margin, x_offset, y_offset, max_width, col_count, importer
         params = [c[2] for c in param_opts.values()]
 
+        # name -> (kind, index, type), one lookup per arg
+        opts = {name: ("bool", idx, None) for name, (idx, _) in bool_opts.items()}
+        opts.update(
+            {name: ("param", idx, typ) for name, (idx, typ, _, _) in param_opts.items()}
+        )
+
         image_paths = []
         for arg in args:
-            if arg in bool_opts:
-                flags[bool_opts[arg]][0] = True
-            elif not arg.startswith("-"):
+            if arg[:1] != "-":
                 image_paths.append(arg)
-            else:
-                keyval = arg.split("=")
-                if len(keyval) == 2 and keyval[0] in param_opts:
-                    param, value = keyval
-                    param_idx = param_opts[param][0]
-                    params[param_idx] = type(params[param_idx])(value)
+                continue
+            name, sep, value = arg.partition("=")
+            kind, idx, typ = opts.get(name, (None, 0, None))
+            if kind == "bool" and not sep:
+                flags[idx] = True
+            elif kind == "param" and sep:
+                params[idx] = typ(value)
 
         setup(image_paths, *(flags + params))  # type: ignore
     else: